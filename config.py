@@ -2,31 +2,85 @@
 # -*- coding: utf-8 -*-
 
 import configparser
+import os
+import re
+from functools import cached_property
+
+# Matches each pin:comment entry of temp_init/used_pins.
+_USED_PIN = r'\s*(\d+)\s*:([^,]*)'
+_USED_PIN_RE = re.compile(_USED_PIN)
+# Matches a whole used_pins value: entries separated by commas, any of which
+# may be empty.
+_USED_PINS_RE = re.compile(
+    r'(?:\s*\d+\s*:[^,]*)?(?:,(?:\s*\d+\s*:[^,]*)?)*')
 
 class Config:
 
+    # Attributes parsed lazily from the file, dropped when it is reread.
+    _LAZY = ('used_pins', 'used_pin_set', 'reserved_channels', 'echo')
+
     def __init__(self, config_path):
         self.config_path = config_path
-        self.used_pins = None
-        self.echo = None
-        self.reserved_channels = None
+        # Cached parser and the mtime of the file it was read from.
+        self._parser = None
+        self._mtime = None
         self.get_vars()
 
     def get_vars(self):
+        '''
+        Reads the config file. The file is only reparsed if it has changed
+        since it was last read; each attribute is then parsed from it the
+        first time it is accessed.
+        '''
+        if self._read_parser():
+            for name in self._LAZY:
+                self.__dict__.pop(name, None)
+
+    def _read_parser(self):
+        '''
+        Rereads the parser if the file has changed since it was last read.
+        Returns True if it was reread.
+        '''
+        st = os.stat(self.config_path)
+        if st.st_mtime_ns == self._mtime:
+            return False
         config = configparser.ConfigParser()
         config.read(self.config_path)
-        used_pins = config['temp_init']['used_pins']
-        used_pins = used_pins.split(',')
-        self.used_pins = {int(x.split(':')[0]):x.split(':')[1] for x in used_pins if x != ''}
-        print(self.used_pins)
-        reserved_channels = config['RPIO']['reserved_channels']
-        reserved_channels = reserved_channels.split(',')
-        self.reserved_channels = [int(x) for x in reserved_channels if x != '']
-        self.echo = config['py_behavior']['echo']
+        self._parser = config
+        self._mtime = st.st_mtime_ns
+        return True
+
+    def _raw(self, section, key):
+        return self._parser[section][key]
+
+    @cached_property
+    def used_pins(self):
+        used_pins = self._raw('temp_init', 'used_pins')
+        if not _USED_PINS_RE.fullmatch(used_pins):
+            raise ValueError('malformed used_pins in {}: {!r}'.format(
+                self.config_path, used_pins))
+        return {int(k): v for k, v in _USED_PIN_RE.findall(used_pins)}
+
+    @cached_property
+    def used_pin_set(self):
+        return set(self.used_pins)
+
+    @cached_property
+    def reserved_channels(self):
+        reserved_channels = self._raw('RPIO', 'reserved_channels').split(',')
+        return frozenset(int(x) for x in reserved_channels if x)
+
+    @cached_property
+    def echo(self):
+        return self._parser.getboolean('py_behavior', 'echo', fallback=False)
 
     def write(self):
-        config = configparser.ConfigParser()
-        config.read(self.config_path)
+        # Pick up any edits made to the file since it was last read, so they
+        # aren't overwritten. Only the parser is refreshed; the attributes,
+        # and the pins claimed in them, are left as they are.
+        self._read_parser()
+        config = self._parser
         # Permanent variables go here
         with open(self.config_path, 'w') as file:
             config.write(file)
+        self._mtime = os.stat(self.config_path).st_mtime_ns
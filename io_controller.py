@@ -7,10 +7,57 @@ try:
     from RPIO.PWM import _PWM
 except (ImportError, SystemError):
     print("Couldn't import RPIO")
+import inspect
 import warnings
-from abc import ABCMeta, abstractproperty
+from typing import Dict
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+from abc import ABCMeta, abstractmethod
 import utility
 
+def _quantize_pulse(angle, rng, pulse_zero, pulse_range, sign, incr):
+    '''
+    Converts an angle to a pulse width rounded down to the PWM increment.
+    Works elementwise on NumPy arrays as well as on scalars. Left
+    uncompiled: numba's per-call dispatch costs more than this arithmetic,
+    and each new mix of int/float arguments would trigger a recompile.
+    '''
+    ratio = angle / rng * sign
+    pulse = pulse_zero + pulse_range * ratio
+    return (pulse // incr) * incr
+
+
+def _quantize_pulses(angles, ranges, pulse_zero, pulse_range, sign, incr):
+    '''
+    Array version of _quantize_pulse, compiled when numba is available. The
+    loop is serial; a controller's dozen or so servos are far too few to
+    repay starting numba's threading layer.
+    '''
+    pulses = np.empty_like(angles)
+    for i in range(angles.shape[0]):
+        ratio = angles[i] / ranges[i] * sign[i]
+        pulse = pulse_zero[i] + pulse_range[i] * ratio
+        pulses[i] = (pulse // incr[i]) * incr[i]
+    return pulses
+
+
+if njit is not None:
+    _quantize_pulses = njit(cache=True, fastmath=True)(_quantize_pulses)
+else:
+    # Without numba, NumPy broadcasting over the scalar kernel is faster than
+    # an interpreted loop.
+    _quantize_pulses = _quantize_pulse
+
 
 class ABCServo(metaclass=ABCMeta):
     '''
@@ -22,25 +69,34 @@ class ABCServo(metaclass=ABCMeta):
     pin (int) -- the GPIO pin connected to the servo's signal lead.
     channel (RPIO.PWM.Servo) -- the channel used for managing PWM.
 
-    Abstract Properties:
-    pulse (numeric) -- the pulse width delivered to the GPIO pin.
+    Abstract Methods:
+    compute_pulse -- returns the pulse width delivered to the GPIO pin.
     '''
 
+    __slots__ = ('controller', 'channel', 'name', 'pin', '_last_pulse')
+
     def __init__(self, controller, name, pin, channel):
         self.controller = controller
         self.channel = channel
         self.name = name
         self.pin = pin
+        # The last pulse width sent, so unchanged pulses can be skipped.
+        self._last_pulse = None
 
     def update(self):
         '''
-        Updates the signal to the GPIO pin.
+        Updates the signal to the GPIO pin. Does nothing if the pulse width
+        hasn't changed since the last update, as the PWM channel keeps
+        repeating the last pulse.
         '''
-        if self.pulse is not None:
-            self.controller.set_servo(self.pin, self.pulse)
+        pulse = self.compute_pulse()
+        if pulse is None or pulse == self._last_pulse:
+            return
+        self.controller.set_servo(self.pin, pulse)
+        self._last_pulse = pulse
 
-    @abstractproperty
-    def pulse(self):
+    @abstractmethod
+    def compute_pulse(self):
         pass
 
 
@@ -69,8 +125,6 @@ class Servo(ABCServo):
         channel (RPIO.PWM.Servo) -- the channel used for managing PWM.
         range_of_motion (numeric) -- the total range of motion expressed in 
             degrees. Defaults to 90.
-        pulse (tuple) -- the minimum and maximum pulse width. 
-            Defaults to (1.0, 2.0)
         reverse (bool) -- True if the maximum pulse width corresponds with a 
             nominal position of 0; False if the maximum pulse width corresponds 
             with a nominal position equal to range_of_motion. 
@@ -79,13 +133,26 @@ class Servo(ABCServo):
             actual current position). Defaults to 0.
     '''
 
+    __slots__ = ('range', '_pulse_lo', '_pulse_hi', '_pulse_range',
+                 '_pulse_zero', '_pulse_incr', '_sign', 'reverse', '_angle',
+                 '_idx')
+
     def __init__(self, controller, name, pin, channel, range_of_motion=90, 
                  pulse=(1.0, 2.0), reverse=False):
         super().__init__(controller, name, pin, channel)
         self.range = range_of_motion
-        self.pulse = sorted(pulse)
+        self._pulse_lo, self._pulse_hi = sorted(pulse)
         self.reverse = reverse
+        # Index into the owning controller's servo arrays, set by
+        # OutputController._register when NumPy is available.
+        self._idx = None
         self.angle = 0
+        # The pulse bounds and increment are fixed for the servo's lifetime,
+        # so work them out once rather than on every update.
+        self._pulse_range = self._pulse_hi - self._pulse_lo
+        self._pulse_zero = self._pulse_hi if reverse else self._pulse_lo
+        self._sign = -1 if reverse else 1
+        self._pulse_incr = controller.pulse_incr
 
     def set(self, angle):
         '''
@@ -95,11 +162,23 @@ class Servo(ABCServo):
             angle (numeric) -- the angle to set the servo to. Must be between
                 0 and self.range.
         '''
-        if not 0 < angle < self.range:
+        if not 0 <= angle <= self.range:
             raise ValueError('angle must be between 0 and range')
         self.angle = angle
         self.update()
 
+    def set_fast(self, angle):
+        '''
+        Sets the servo angle and updates it, clamping out of range angles
+        instead of raising. Intended for tight control loops.
+
+        Arguments:
+            angle (numeric) -- the angle to set the servo to.
+        '''
+        self.angle = (0 if angle < 0 else
+                      self.range if angle > self.range else angle)
+        self.update()
+
     def increment(self, change):
         '''
         Moves the servo by a set amount.
@@ -110,124 +189,449 @@ class Servo(ABCServo):
         self.set(self.angle + change)
 
     @property
-    def pulse(self):
+    def angle(self):
         '''
-        The pulse width for the servo.
+        The current set position. Mirrored into the controller's angle array
+        once the servo is registered.
         '''
-        position_ratio = self.angle / self.range
-        position_ratio *= -1 if self.reverse else 1
-        pulse_range = max(self.pulse) - min(self.pulse)
-        pulse_incr = _PWM.get_pulse_incr_us()
-        pulse = pulse_range * position_ratio + min(self.pulse)
-        pulse = pulse // pulse_incr
-        pulse *= pulse_incr
-        return pulse
+        return self._angle
+
+    @angle.setter
+    def angle(self, angle):
+        self._angle = angle
+        if self._idx is not None:
+            self.controller._angles[self._idx] = angle
+
+    def compute_pulse(self):
+        '''
+        Returns the pulse width for the servo's current angle.
+        '''
+        return _quantize_pulse(self._angle, self.range, self._pulse_zero,
+                               self._pulse_range, self._sign,
+                               self._pulse_incr)
 
 
 class ContinousServo(ABCServo):
 
+    __slots__ = ('_pulse_lo', '_pulse_hi', 'reverse', 'speed', '_zero_pulse',
+                 '_half_range')
+
     def __init__(self, controller, name, pin, channel, pulse, reverse=False):
-        super().__init__(self, controller, name, pin, channel)
+        super().__init__(controller, name, pin, channel)
+        self._pulse_lo, self._pulse_hi = sorted(pulse)
         self.reverse = reverse
         self.speed = 0
+        self._zero_pulse = 0.5 * (self._pulse_lo + self._pulse_hi)
+        self._half_range = 0.5 * (self._pulse_hi - self._pulse_lo)
+        if reverse:
+            self._half_range = -self._half_range
 
     def set(self, speed):
-        if not -1 < speed < 1:
+        if not -1 <= speed <= 1:
             raise ValueError('speed must be between -1 and 1')
         self.speed = speed
 
+    def set_fast(self, speed):
+        self.speed = -1 if speed < -1 else 1 if speed > 1 else speed
+
     def increment(self, change):
         self.set(self.speed + change)
 
-    @property
-    def pulse(self):
-        zero_pulse = (min(self.pulse) + max(self.pulse)) / 2
-        pulse_range = max(self.pulse) - min(self.pulse)
-        return zero_pulse + self.speed * pulse_range / 2
+    def compute_pulse(self):
+        return self._zero_pulse + self.speed * self._half_range
 
 
 class LED:
 
+    __slots__ = ('name', 'pin', '_channel', 'brightness', '_scale',
+                 '_last_pulse_width', '_programmed')
+
     def __init__(self, name, pin, channel):
         self.name = name
         self.pin = pin
         self.channel = channel
         self.brightness = 0
 
+    @property
+    def channel(self):
+        return self._channel
+
+    @channel.setter
+    def channel(self, channel):
+        self._channel = channel
+        self._clear_scale()
+        # Whether a pulse for this pin may be on the channel.
+        self._programmed = False
+
+    def _clear_scale(self):
+        # Fetched lazily by update(), since the DMA channel may not be
+        # initialised yet.
+        self._scale = None
+        self._last_pulse_width = None
+
     def set(self, brightness):
-        if not 0 < brightness < 100:
+        if not 0 <= brightness <= 100:
             raise ValueError('brightness must be between 0 and 100')
         self.brightness = brightness
 
+    def set_fast(self, brightness):
+        self.brightness = (0 if brightness < 0 else
+                           100 if brightness > 100 else brightness)
+
     def update(self):
-        subcycle_time = RPIO.PWM.get_channel_subcycle_time_us(self.channel)
-        granularity = RPIO.PWM.get_pulse_incr_us()
-        pulse_width = self.brightness / 100 * subcycle_time / granularity
-        RPIO.PWM.clear_channel_gpio(self.channel, self.pin)
-        RPIO.PWM.add_channel_pulse(self.channel, self.pin, 0, pulse_width)
+        if self._scale is None:
+            subcycle_time = RPIO.PWM.get_channel_subcycle_time_us(self.channel)
+            granularity = RPIO.PWM.get_pulse_incr_us()
+            self._scale = subcycle_time / (100.0 * granularity)
+        pulse_width = int(self.brightness * self._scale)
+        if pulse_width == self._last_pulse_width:
+            return
+        # add_channel_pulse only adds edges, so an existing pulse has to be
+        # cleared first; there is nothing to clear before the first pulse,
+        # and nothing to add for a pulse width of 0.
+        if self._programmed:
+            RPIO.PWM.clear_channel_gpio(self.channel, self.pin)
+        if pulse_width:
+            RPIO.PWM.add_channel_pulse(self.channel, self.pin, 0, pulse_width)
+        self._programmed = bool(pulse_width)
+        self._last_pulse_width = pulse_width
+
+
+class PigpioBackend:
+    '''
+    Drives servos through the pigpio daemon, which keeps the 50 Hz pulse
+    train going in hardware so that Python only has to act when a pulse
+    width changes. pigpio addresses pins by their Broadcom (BCM) numbers.
+
+    Arguments:
+        host (str) -- the host running pigpiod. Defaults to pigpio's default.
+        port (int) -- the port pigpiod listens on. Defaults to pigpio's
+            default.
+
+    Attributes:
+        pi (pigpio.pi) -- the connection to the daemon.
+    '''
+
+    # pigpio sets servo pulse widths to the microsecond.
+    PULSE_INCR_US = 1
+
+    def __init__(self, host=None, port=None):
+        kwargs = {}
+        if host is not None:
+            kwargs['host'] = host
+        if port is not None:
+            kwargs['port'] = port
+        self.pi = pigpio.pi(**kwargs)
+
+    @property
+    def connected(self):
+        return bool(self.pi.connected)
+
+    def set_servo(self, pin, pulse):
+        self.pi.set_servo_pulsewidth(pin, int(pulse))
+
+    def stop(self):
+        self.pi.stop()
 
 
 class OutputController:
 
-    def __init__(self, config):
-        RPIO.setmode(RPIO.BOARD)
+    # device type (str): format string for the comment its pin is claimed with
+    _PIN_COMMENTS = {'servo': 'servo {}',
+                     'continuous_servo': 'continuous servo {}',
+                     'led': 'led {}'}
+
+    def __init__(self, config, use_pigpio=False, devices=None):
+        # Servo pulses go through backend if set, else through RPIO.PWM.
+        self.backend = None
+        # There is deliberately no fallback to RPIO.PWM: pigpio uses BCM pin
+        # numbers and RPIO.PWM uses BOARD numbers here, so falling back would
+        # move the outputs to other GPIOs.
+        if use_pigpio:
+            if pigpio is None:
+                raise RuntimeError("couldn't import pigpio")
+            backend = PigpioBackend()
+            if not backend.connected:
+                backend.stop()
+                raise RuntimeError('pigpiod not available')
+            self.backend = backend
+        # pigpio only understands BCM numbers, so keep RPIO consistent with it.
+        RPIO.setmode(RPIO.BOARD if self.backend is None else RPIO.BCM)
         # update (int): channel (int)
         self.update_channels = {}
         # channel (int): RPIO.Servo
         self.channel_servos = {}
         # name (str): Servo
-        self.servos = {}
+        self.servos: Dict[str, ABCServo] = {}
         # name (str): Actuator
-        self.actuators = {}
+        self.actuators: Dict[str, object] = {}
         # name (str): LED
-        self.leds = {}
+        self.leds: Dict[str, LED] = {}
         self.config = config
+        # The PWM pulse width increment in microseconds. RPIO only knows it
+        # once RPIO.PWM.setup() has run, so it is read when the first PWM
+        # channel is initialised.
+        self.pulse_incr = None if self.backend is None \
+            else self.backend.PULSE_INCR_US
+        # pin (int): RPIO.Servo
+        self._pin_channels = {}
+        # Struct-of-arrays copy of the registered Servos' pulse parameters,
+        # used by tick() to compute every pulse in one pass. Only the list is
+        # kept if NumPy isn't installed.
+        self._soa_servos = []
+        if np is not None:
+            self._angles = np.zeros(0)
+            self._ranges = np.zeros(0)
+            self._pulse_zero = np.zeros(0)
+            self._pulse_range = np.zeros(0)
+            self._sign = np.zeros(0)
+            self._incr = np.zeros(0)
+        if devices:
+            self.bulk_configure(devices)
+
+    def bulk_configure(self, devices):
+        '''
+        Creates several devices at once, claiming all of their pins in a
+        single pass before any device is built. Either every device is
+        created or, if any fails, none are and their pins are released.
+
+        Arguments:
+            devices (dict) -- name (str): spec (dict). Each spec has a 'type'
+                of 'servo', 'continuous_servo' or 'led', a 'pin', and any
+                further keyword arguments for the matching new_* method.
+
+        Returns:
+            dict -- name (str): the created device.
+        '''
+        makers = {'servo': self.new_servo,
+                  'continuous_servo': self.new_continuous_servo,
+                  'led': self.new_led}
+        removers = {'servo': self.remove_servo,
+                    'continuous_servo': self.remove_servo,
+                    'led': self.remove_led}
+        specs = []
+        for name, spec in devices.items():
+            spec = dict(spec)
+            device_type = spec.pop('type')
+            if device_type not in makers:
+                raise ValueError('unknown device type {}'.format(device_type))
+            self._check_name(self.leds if device_type == 'led'
+                             else self.servos, name)
+            # Raises TypeError for missing or unknown arguments before any
+            # pin is claimed.
+            inspect.signature(makers[device_type]).bind(name, claim=False,
+                                                        **spec)
+            specs.append((name, device_type, spec))
+        utility.claim_pins([(spec['pin'], RPIO.OUT) for _, _, spec in specs],
+                           self.config,
+                           [self._PIN_COMMENTS[device_type].format(name)
+                            for name, device_type, _ in specs])
+        created = {}
+        try:
+            for name, device_type, spec in specs:
+                created[name] = makers[device_type](name, claim=False, **spec)
+        except Exception:
+            for name, device_type, spec in specs:
+                if name in created:
+                    removers[device_type](name)
+                else:
+                    utility.release_pin(spec['pin'], self.config)
+            raise
+        return created
 
     def new_servo(self, name, pin, update=20000, range_of_motion=90,
-                  pulse=(1.0, 2.0), reverse=False):
-        channel = self.get_servo_channel(update)
-        utility.claim_pin(pin, RPIO.OUT, self.config,
-                          'servo {}'.format(name))
+                  pulse=(1.0, 2.0), reverse=False, claim=True):
+        self._check_name(self.servos, name)
+        channel = self.get_servo_channel(update) if self.backend is None \
+            else None
+        if claim:
+            utility.claim_pin(pin, self.config, RPIO.OUT,
+                              self._PIN_COMMENTS['servo'].format(name))
         servo = Servo(self, name, pin, channel, range_of_motion, pulse, reverse)
-        self.servos['name'] = servo
+        self.servos[name] = servo
+        self._pin_channels[pin] = channel
+        self._register(servo)
         return servo
 
-    def new_continuous_servo(self, name, pin, pulse, reverse=False):
-        channel = self.get_servo_channel()
-        utility.claim_pin(pin, RPIO.OUT, self.config, 
-                          'continuous servo {}'.format(name))
-        servo = ContinousServo(name, pin, channel, pulse, reverse)
-        self.servos['name'] = servo
+    def new_continuous_servo(self, name, pin, pulse, reverse=False,
+                             claim=True):
+        self._check_name(self.servos, name)
+        channel = self.get_servo_channel() if self.backend is None else None
+        if claim:
+            utility.claim_pin(pin, self.config, RPIO.OUT,
+                              self._PIN_COMMENTS['continuous_servo'].format(
+                                  name))
+        servo = ContinousServo(self, name, pin, channel, pulse, reverse)
+        self.servos[name] = servo
+        self._pin_channels[pin] = channel
         return servo
 
-    def new_led(self, name, pin):
-        if self.update_channels:
-            channel = self.update_channels[list(self.update_channels.keys())[0]]
-        else:
+    def new_led(self, name, pin, claim=True):
+        self._check_name(self.leds, name)
+        channel = next(iter(self.update_channels.values()), None)
+        if channel is None:
             channel = self.new_dma_channel()
-        utility.claim_pin(pin, RPIO.OUT, self.config, 'led {}'.format(name))
+            if not RPIO.PWM.is_setup():
+                RPIO.PWM.setup()
+            RPIO.PWM.init_channel(channel)
+            if self.pulse_incr is None:
+                self.refresh_pulse_incr()
+        if claim:
+            utility.claim_pin(pin, self.config, RPIO.OUT,
+                              self._PIN_COMMENTS['led'].format(name))
         led = LED(name, pin, channel)
-        self.leds['name'] = led
+        self.leds[name] = led
         return led
 
-    def get_servo_channel(self, update_cycle=None):
-        try:
-            if update_cycle is None:
-                return self.channel_servos[self.update_channels[
-                       list(self.update_channels.keys())[0]]]
-            return self.channel_servos[self.update_channels[update_cycle]]
-        except (KeyError, IndexError):
-            if update_cycle not in self.channel_servos:
-                return self.new_servo_channel(update_cycle)
+    @staticmethod
+    def _check_name(devices, name):
+        '''
+        Raises ValueError if name is already used in devices, so that an
+        existing device is never silently replaced.
+        '''
+        if name in devices:
+            raise ValueError('device {} already exists'.format(name))
+
+    def remove_servo(self, name):
+        '''
+        Stops a servo's output, releases its pin and forgets it.
+
+        Arguments:
+            name (str) -- the name of the servo.
+        '''
+        servo = self.servos.pop(name)
+        if servo._last_pulse is not None:
+            if self.backend is not None:
+                self.backend.set_servo(servo.pin, 0)
             else:
-                raise AttributeError('inconsistency between update_channels and\
-                                      channel_servos with update cycle \
-                                      {}'.format(update_cycle))
+                self._pin_channels[servo.pin].stop_servo(servo.pin)
+        del self._pin_channels[servo.pin]
+        if isinstance(servo, Servo):
+            self._deregister(servo)
+        utility.release_pin(servo.pin, self.config)
+
+    def remove_led(self, name):
+        '''
+        Stops an LED's output, releases its pin and forgets it.
+
+        Arguments:
+            name (str) -- the name of the LED.
+        '''
+        led = self.leds.pop(name)
+        if led._programmed:
+            RPIO.PWM.clear_channel_gpio(led.channel, led.pin)
+        utility.release_pin(led.pin, self.config)
+
+    def cleanup(self):
+        '''
+        Stops every servo and LED, releases their pins and closes the
+        connection to the backend, if any.
+        '''
+        for name in list(self.servos):
+            self.remove_servo(name)
+        for name in list(self.leds):
+            self.remove_led(name)
+        if self.backend is not None:
+            self.backend.stop()
+            self.backend = None
+
+    def set_servo(self, pin, pulse):
+        '''
+        Sends a pulse width to a servo's GPIO pin.
+
+        Arguments:
+            pin (int) -- the GPIO pin connected to the servo's signal lead.
+            pulse (numeric) -- the pulse width in microseconds.
+        '''
+        if self.backend is not None:
+            self.backend.set_servo(pin, pulse)
+        else:
+            self._pin_channels[pin].set_servo(pin, int(pulse))
+
+    def tick(self):
+        '''
+        Recomputes the pulse for every registered Servo in one vectorised pass
+        and sends them out. Without NumPy, each Servo is updated in turn.
+        '''
+        if not self._soa_servos:
+            return
+        if np is None:
+            for servo in self._soa_servos:
+                servo.update()
+            return
+        pulses = _quantize_pulses(self._angles, self._ranges,
+                                  self._pulse_zero, self._pulse_range,
+                                  self._sign, self._incr)
+        for servo, pulse in zip(self._soa_servos, pulses.tolist()):
+            if pulse != servo._last_pulse:
+                self.set_servo(servo.pin, pulse)
+                servo._last_pulse = pulse
+
+    def refresh_pulse_incr(self):
+        '''
+        Rereads the PWM pulse width increment and passes it on to the existing
+        servos and LEDs. Call this after changing the increment with
+        RPIO.PWM.setup(pulse_incr_us=...). Servos on the pigpio backend keep
+        its fixed increment.
+        '''
+        if self.backend is None:
+            self.pulse_incr = _PWM.get_pulse_incr_us()
+        for servo in self._soa_servos:
+            servo._pulse_incr = self.pulse_incr
+            servo._last_pulse = None
+        if np is not None:
+            self._incr[:] = self.pulse_incr
+        for led in self.leds.values():
+            led._clear_scale()
+
+    def _register(self, servo):
+        '''
+        Adds a Servo to the arrays used by tick().
+        '''
+        self._soa_servos.append(servo)
+        if np is None:
+            return
+        servo._idx = len(self._soa_servos) - 1
+        self._angles = np.append(self._angles, servo.angle)
+        self._ranges = np.append(self._ranges, servo.range)
+        self._pulse_zero = np.append(self._pulse_zero, servo._pulse_zero)
+        self._pulse_range = np.append(self._pulse_range, servo._pulse_range)
+        self._sign = np.append(self._sign, servo._sign)
+        self._incr = np.append(self._incr, servo._pulse_incr)
+
+    def _deregister(self, servo):
+        '''
+        Removes a Servo from the arrays used by tick().
+        '''
+        if np is None:
+            self._soa_servos.remove(servo)
+            return
+        idx = servo._idx
+        del self._soa_servos[idx]
+        self._angles = np.delete(self._angles, idx)
+        self._ranges = np.delete(self._ranges, idx)
+        self._pulse_zero = np.delete(self._pulse_zero, idx)
+        self._pulse_range = np.delete(self._pulse_range, idx)
+        self._sign = np.delete(self._sign, idx)
+        self._incr = np.delete(self._incr, idx)
+        servo._idx = None
+        for i, other in enumerate(self._soa_servos[idx:], idx):
+            other._idx = i
+
+    def get_servo_channel(self, update_cycle=None):
+        if update_cycle is None:
+            update_cycle = next(iter(self.update_channels), None)
+        channel = self.update_channels.get(update_cycle)
+        if channel is None or channel not in self.channel_servos:
+            return self.new_servo_channel(update_cycle)
+        return self.channel_servos[channel]
 
     def new_servo_channel(self, update_cycle, channel=None):
         channel = self.new_dma_channel(update_cycle, channel)
         new_servo_channel = RPIO.PWM.Servo(channel, update_cycle)
         self.channel_servos[channel] = new_servo_channel
+        if self.pulse_incr is None:
+            self.refresh_pulse_incr()
         return new_servo_channel
 
     def new_dma_channel(self, update_cycle=None, channel=None):
@@ -243,10 +647,11 @@ class OutputController:
         return channel     
 
     def get_dma_channel(self):
-        available = [x for x in range(15) if
-                     (x not in self.config.reserved_channels and
-                      x not in self.channel_servos)]
-        if available:
-            return available[0]
-        else:
-            return
+        # Channels in update_channels may be in use without a servo, e.g.
+        # one initialised for an LED.
+        in_use = set(self.update_channels.values())
+        for x in range(15):
+            if (x not in self.config.reserved_channels and
+                    x not in self.channel_servos and x not in in_use):
+                return x
+        return None
@@ -15,20 +15,58 @@ def claim_pin(pin, config, io_type, comment=""):
     config -- the config file to claim the pin in. config.Config
     comment -- a comment explaining what use the pin is claimed for.
     '''
-    if pin in config.used_pins:
+    pin = int(pin)
+    if pin in config.used_pin_set:
         raise AttributeError('pin {} already claimed'.format(pin))
     else:
         mode = RPIO.IN if io_type in ('in', 'IN', RPIO.IN) else RPIO.OUT
         RPIO.setup(pin, mode)
         config.used_pins[pin] = comment
+        config.used_pin_set.add(pin)
+
+
+def claim_pins(pins_modes, config, comments=""):
+    '''
+    Claim several pins at once. All the pins are checked before any are set
+    up, so either every pin is claimed or none are.
+
+    Arguments:
+    pins_modes -- the pins to be claimed and the mode for each. Dict of
+        pin: io_type, or iterable of (pin, io_type) pairs
+    config -- the config file to claim the pins in. config.Config
+    comments -- a comment for all the pins (str), or one per pin.
+    '''
+    if isinstance(pins_modes, dict):
+        pins_modes = pins_modes.items()
+    pins_modes = [(int(pin), io_type) for pin, io_type in pins_modes]
+    pins = [pin for pin, _ in pins_modes]
+    if isinstance(comments, str):
+        comments = [comments] * len(pins)
+    else:
+        comments = list(comments)
+        if len(comments) != len(pins):
+            raise ValueError('got {} comments for {} pins'.format(
+                len(comments), len(pins)))
+    if len(set(pins)) != len(pins):
+        raise AttributeError('pins {} contain duplicates'.format(pins))
+    claimed = [pin for pin in pins if pin in config.used_pin_set]
+    if claimed:
+        raise AttributeError('pins {} already claimed'.format(claimed))
+    for pin, io_type in pins_modes:
+        mode = RPIO.IN if io_type in ('in', 'IN', RPIO.IN) else RPIO.OUT
+        RPIO.setup(pin, mode)
+    config.used_pins.update(zip(pins, comments))
+    config.used_pin_set.update(pins)
 
 
 def release_pin(pin, config):
     '''
     Release a pin
     '''
-    if pin in config.used_pins:
+    pin = int(pin)
+    if pin in config.used_pin_set:
         del config.used_pins[pin]
+        config.used_pin_set.discard(pin)
     else:
         if config.echo:
             warnings.warn('tried to release unclaimed pin')